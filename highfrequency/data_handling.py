@@ -1,40 +1,186 @@
+import datetime
+import functools
 import pandas as pd
 import polars as pl
-from .internal_data_handling import *
+from .internal_data_handling import (
+    check_column_names,
+    _polars_input,
+    check_trade_data,
+    check_quote_data,
+    _conform_schema,
+    _TRADE_SCHEMA,
+    _QUOTE_SCHEMA,
+)
 from typing import List
-from .helpers.exchange_names import EXCHANGES
+from .helpers.exchange_names import EXCHANGES, EXCHANGE_KEYS
 from .helpers.schemas import TColumns, QColumns
-import warnings
+
+
+# cache the enum attribute chains used on every call as plain string constants;
+# QColumns shares the dt/symbol/ex names with TColumns
+_TIME = TColumns.TIME.value.name
+_PRICE = TColumns.PRICE.value.name
+_SIZE = TColumns.SIZE.value.name
+_SYMBOL = TColumns.SYMBOL.value.name
+_COND = TColumns.CONDITION.value.name
+_EX = TColumns.EXCHANGE.value.name
+_BID = QColumns.BID.value.name
+_OFR = QColumns.OFR.value.name
+_BIDSIZ = QColumns.BIDSIZ.value.name
+_OFRSIZ = QColumns.OFRSIZ.value.name
+
+
+# mapping from exchange code to exchange name, built once for the vectorized print path
+_EXCHANGE_NAMES_DF = pl.DataFrame(
+    {
+        _EX: list(EXCHANGES.keys()),
+        "ex_name": list(EXCHANGES.values()),
+    }
+)
+
+
+def _print_exchange_winners(winners: pl.LazyFrame) -> None:
+    """
+    | Print the selected exchange per symbol using a single vectorized format pass.
+
+    :param winners: LazyFrame with one row per winning (symbol, exchange) pair.
+    """
+    messages = (
+        winners.join(_EXCHANGE_NAMES_DF.lazy(), on=_EX)
+        .select(
+            pl.format(
+                "Symbol: {}, Selected Exchange: {}",
+                _SYMBOL,
+                "ex_name",
+            )
+        )
+        .collect()
+        .to_series()
+    )
+    print("\n".join(messages))
+
+
+def _with_time_order(
+    lf: pl.LazyFrame, time_column: str, assume_sorted: bool
+) -> pl.LazyFrame:
+    """
+    | Mark the time column as sorted when the input is known to be time-ordered, otherwise sort it.
+
+    | Filters preserve sortedness on the key column, so marking instead of sorting turns k chained
+    filters from k sorts into none while downstream operations still fast-path on the flag.
+
+    :param lf: LazyFrame to order.
+    :param time_column: Name of the time column.
+    :param assume_sorted: If True, only flag the column as sorted instead of sorting.
+    :return: LazyFrame with the time column either flagged as sorted or sorted.
+    """
+    if assume_sorted:
+        return lf.set_sorted(time_column)
+    return lf.sort(time_column)
+
+
+def finalize(df: pl.DataFrame, time_column: str = _TIME) -> pl.DataFrame:
+    """
+    | Perform the terminal time sort of a filter pipeline, skipping it when the time column is
+    already flagged as sorted.
+
+    :param df: DataFrame produced by the filter functions.
+    :param time_column: Name of the time column.
+    :return: DataFrame sorted by the time column.
+    """
+    if df[time_column].flags["SORTED_ASC"]:
+        return df
+    return df.sort(time_column)
+
+
+def _select_exchange_lazy(t_data: pl.LazyFrame, exchange: str = "N") -> pl.LazyFrame:
+    """
+    | Lazy core of :func:`select_exchange`. Expects validated data and leaves sorting to the caller.
+
+    :param t_data: LazyFrame containing raw trade data.
+    :param exchange: Name of the exchange to filter the data for.
+    :return: LazyFrame containing only data from the specified exchange.
+    """
+    return t_data.filter(pl.col(_EX) == exchange)
 
 
 # done and checked
+@_polars_input
 def select_exchange(
-    t_data: pl.DataFrame,
+    t_data: pl.DataFrame | pl.LazyFrame,
     exchange: str = "N",
-) -> pl.DataFrame:
+    assume_sorted: bool = True,
+) -> pl.DataFrame | pl.LazyFrame:
     """
     | Filter the Raw Trade data to retain only the data from the specified exchange. Be default the NYSE is selected.
 
-    :param t_data: DataFrame containing raw trade data.
+    | A LazyFrame input is validated from its schema alone and returned lazily, with the exchange
+    filter as the first plan node so predicate pushdown can carry it into the scan.
+
+    :param t_data: DataFrame or LazyFrame containing raw trade data.
     :param exchange: Name of the exchange to filter the data for.
+    :param assume_sorted: If True, assume the input is already time-sorted and skip re-sorting.
     :return:
     """
 
+    # ensure the exchange selected is one of the allowed exchanges
+    if exchange not in EXCHANGE_KEYS:
+        raise ValueError(f"Exchange '{exchange}' not found in the list of exchanges")
+
     # check data consistency
     t_data = check_column_names(t_data)
+    if isinstance(t_data, pl.LazyFrame):
+        t_data = _conform_schema(t_data, _TRADE_SCHEMA)
+        return _with_time_order(
+            _select_exchange_lazy(t_data, exchange), _TIME, assume_sorted
+        )
     t_data = check_trade_data(t_data)
 
-    # ensure the exchange selected is one of the allowed exchanges
-    if exchange not in EXCHANGES:
-        raise ValueError(f"Exchange '{exchange}' not found in the list of exchanges")
-
     # Filter the data where 'ex' column matches the specified 'exchange' value
-    filtered_data = t_data.filter(pl.col(TColumns.EXCHANGE.value.name) == exchange)
+    return _with_time_order(
+        _select_exchange_lazy(t_data.lazy(), exchange),
+        _TIME,
+        assume_sorted,
+    ).collect()
+
+
+def _trade_exchange_winners_lazy(t_data: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    | Compute, per symbol, the exchange(s) with the highest total trade volume.
+
+    :param t_data: LazyFrame containing validated trade data.
+    :return: LazyFrame with one row per winning (symbol, exchange) pair.
+    """
+    # Group by 'symbol' and 'exchange', and aggregate 'size' by summing
+    aggregated_df = t_data.group_by(
+        [_SYMBOL, _EX]
+    ).agg(pl.sum(_SIZE).alias("total_size"))
+
+    # Keep only the exchanges with the maximum size for each symbol
+    return aggregated_df.filter(
+        pl.col("total_size") == pl.col("total_size").max().over(_SYMBOL)
+    )
+
+
+def _auto_select_exchange_trades_lazy(t_data: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    | Lazy core of :func:`auto_select_exchange_trades`. Expects validated data and leaves sorting to the caller.
+
+    :param t_data: LazyFrame containing validated trade data.
+    :return: LazyFrame containing only data from the exchange with the highest trading volume.
+    """
+    winners = _trade_exchange_winners_lazy(t_data)
 
-    return filtered_data.sort(TColumns.TIME.value.name)
+    # Semi-join keeps the original rows whose (symbol, exchange) pair won
+    return t_data.join(
+        winners,
+        on=[_SYMBOL, _EX],
+        how="semi",
+    )
 
 
 # done and checked
+@_polars_input
 def auto_select_exchange_trades(
     t_data: pl.DataFrame, print_exchange: bool = False
 ) -> pl.DataFrame:
@@ -54,39 +200,60 @@ def auto_select_exchange_trades(
     t_data = check_column_names(t_data)
     t_data = check_trade_data(t_data)
 
-    # Step 1: Group by 'symbol' and 'exchange', and aggregate 'size' by summing
-    aggregated_df = t_data.group_by(
-        [TColumns.SYMBOL.value.name, TColumns.EXCHANGE.value.name]
-    ).agg(pl.sum(TColumns.SIZE.value.name).alias("total_size"))
+    lazy_data = t_data.lazy()
 
-    # Step 2: Find the maximum size exchange for each symbol
-    max_size_df = aggregated_df.group_by(TColumns.SYMBOL.value.name).agg(
-        pl.max("total_size").alias("max_size")
+    # Print the exchange with the highest trading volume
+    if print_exchange:
+        _print_exchange_winners(_trade_exchange_winners_lazy(lazy_data))
+
+    return (
+        _auto_select_exchange_trades_lazy(lazy_data)
+        .sort(_TIME)
+        .collect()
     )
 
-    # Step 3: Join the maximum size with the original aggregated dataframe to filter the exchanges
-    joined_df = aggregated_df.join(max_size_df, on=TColumns.SYMBOL.value.name, how="inner")
 
-    # Step 4: Filter to keep only the exchanges with the maximum size for each symbol
-    filtered_df = joined_df.filter(pl.col("total_size") == pl.col("max_size"))
+def _quote_exchange_winners_lazy(q_data: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    | Compute, per symbol, the exchange(s) with the highest total quoted volume.
 
-    # Step 5: Join back to the original dataframe to get the original rows
-    result_df = t_data.join(
-        filtered_df[[TColumns.SYMBOL.value.name, TColumns.EXCHANGE.value.name]],
-        on=[TColumns.SYMBOL.value.name, TColumns.EXCHANGE.value.name],
-        how="inner",
+    :param q_data: LazyFrame containing validated quote data.
+    :return: LazyFrame with one row per winning (symbol, exchange) pair.
+    """
+    # Group by 'symbol' and 'exchange', and aggregate the quoted volume by summing
+    aggregated_df = (
+        q_data.with_columns(
+            (pl.col(_OFRSIZ) + pl.col(_BIDSIZ)).alias("total_size_temp")
+        )
+        .group_by([_SYMBOL, _EX])
+        .agg(pl.sum("total_size_temp").alias("total_size"))
     )
 
-    # Print the exchange with the highest trading volume
-    if print_exchange:
-        for row in filtered_df.iter_rows():
-            symbol, exchange, _, _ = row
-            print(f"Symbol: {symbol}, Selected Exchange: {EXCHANGES[exchange]}")
+    # Keep only the exchanges with the maximum size for each symbol
+    return aggregated_df.filter(
+        pl.col("total_size") == pl.col("total_size").max().over(_SYMBOL)
+    )
+
+
+def _auto_select_exchange_quotes_lazy(q_data: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    | Lazy core of :func:`auto_select_exchange_quotes`. Expects validated data and leaves sorting to the caller.
+
+    :param q_data: LazyFrame containing validated quote data.
+    :return: LazyFrame containing only data from the exchange with the highest quoted volume.
+    """
+    winners = _quote_exchange_winners_lazy(q_data)
 
-    return result_df.sort(TColumns.TIME.value.name)
+    # Semi-join keeps the original rows whose (symbol, exchange) pair won
+    return q_data.join(
+        winners,
+        on=[_SYMBOL, _EX],
+        how="semi",
+    )
 
 
 # done and checked
+@_polars_input
 def auto_select_exchange_quotes(
         q_data: pl.DataFrame, print_exchange: bool = False
 ) -> pl.DataFrame:
@@ -104,48 +271,38 @@ def auto_select_exchange_quotes(
     q_data = check_column_names(q_data)
     q_data = check_quote_data(q_data)
 
-    # Step 1: Group by 'symbol' and 'exchange', and aggregate 'size' by summing
-    aggregated_df = (
-        q_data.with_columns(
-            (pl.col(QColumns.OFRSIZ.value.name) + pl.col(QColumns.BIDSIZ.value.name)).alias("total_size_temp")
-        )
-        .group_by([QColumns.SYMBOL.value.name, QColumns.EXCHANGE.value.name])
-        .agg(pl.sum("total_size_temp").alias("total_size"))
-    )
-
-    # Step 2: Find the maximum size exchange for each symbol
-    max_size_df = aggregated_df.group_by(QColumns.SYMBOL.value.name).agg(
-        pl.max("total_size").alias("max_size")
-    )
-
-    # Step 3: Join the maximum size with the original aggregated dataframe to filter the exchanges
-    joined_df = aggregated_df.join(max_size_df, on=QColumns.SYMBOL.value.name, how="inner")
+    lazy_data = q_data.lazy()
 
-    # Step 4: Filter to keep only the exchanges with the maximum size for each symbol
-    filtered_df = joined_df.filter(pl.col("total_size") == pl.col("max_size"))
+    # Print the exchange with the highest trading volume
+    if print_exchange:
+        _print_exchange_winners(_quote_exchange_winners_lazy(lazy_data))
 
-    # Step 5: Join back to the original dataframe to get the original rows
-    result_df = q_data.join(
-        filtered_df[[QColumns.SYMBOL.value.name, QColumns.EXCHANGE.value.name]],
-        on=[QColumns.SYMBOL.value.name, QColumns.EXCHANGE.value.name],
-        how="inner",
+    return (
+        _auto_select_exchange_quotes_lazy(lazy_data)
+        .sort(_TIME)
+        .collect()
     )
 
-    # Print the exchange with the highest trading volume
-    if print_exchange:
-        for row in filtered_df.iter_rows():
-            symbol, exchange, _, _ = row
-            print(f"Symbol: {symbol}, Selected Exchange: {EXCHANGES[exchange]}")
 
-    return result_df.sort(QColumns.TIME.value.name)
+def _no_zero_prices_lazy(t_data: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    | Lazy core of :func:`no_zero_prices`. Expects validated data and leaves sorting to the caller.
+
+    :param t_data: LazyFrame containing raw trade data.
+    :return: LazyFrame with rows containing zero prices removed.
+    """
+    # fill_null(False) makes the null handling explicit: rows without a price are dropped
+    return t_data.filter(pl.col(_PRICE).ne(0).fill_null(False))
 
 
 # done and checked
-def no_zero_prices(t_data: pl.DataFrame) -> pl.DataFrame:
+@_polars_input
+def no_zero_prices(t_data: pl.DataFrame, assume_sorted: bool = True) -> pl.DataFrame:
     """
     | Remove rows with zero prices from the DataFrame.
 
     :param t_data: polars DataFrame containing raw trade data.
+    :param assume_sorted: If True, assume the input is already time-sorted and skip re-sorting.
     :return: DataFrame with rows containing zero prices removed.
     """
 
@@ -154,15 +311,32 @@ def no_zero_prices(t_data: pl.DataFrame) -> pl.DataFrame:
     t_data = check_trade_data(t_data)
 
     # return non zero price dataframes
-    return t_data.filter(t_data[TColumns.PRICE.value.name] != 0).sort(TColumns.TIME.value.name)
+    return _with_time_order(
+        _no_zero_prices_lazy(t_data.lazy()), _TIME, assume_sorted
+    ).collect()
+
+
+def _no_zero_quotes_lazy(df: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    | Lazy core of :func:`no_zero_quotes`. Expects validated data and leaves sorting to the caller.
+
+    :param df: LazyFrame containing quote data.
+    :return: LazyFrame with rows containing zero quotes removed.
+    """
+    # fill_null(False) makes the null handling explicit: rows missing either side are dropped
+    return df.filter(
+        (pl.col(_BID).ne(0) & pl.col(_OFR).ne(0)).fill_null(False)
+    )
 
 
 # done and checked
-def no_zero_quotes(df: pl.DataFrame) -> pl.DataFrame:
+@_polars_input
+def no_zero_quotes(df: pl.DataFrame, assume_sorted: bool = True) -> pl.DataFrame:
     """
     | Remove rows with zero bid and offer prices from the DataFrame.
 
     :param df: polars DataFrame containing quote data.
+    :param assume_sorted: If True, assume the input is already time-sorted and skip re-sorting.
     :return: DataFrame with rows containing zero quotes removed.
     """
 
@@ -170,12 +344,76 @@ def no_zero_quotes(df: pl.DataFrame) -> pl.DataFrame:
     df = check_column_names(df)
     df = check_quote_data(df)
 
-    # remove zero quotes and sort by time
-    return df.filter(
-        (df[QColumns.BID.value.name] != 0) & (df[QColumns.OFR.value.name] != 0)
-    ).sort(QColumns.TIME.value.name)
+    # remove zero quotes
+    return _with_time_order(
+        _no_zero_quotes_lazy(df.lazy()), _TIME, assume_sorted
+    ).collect()
+
+
+def _check_market_hours(
+    market_open: tuple[int], market_close: tuple[int]
+) -> None:
+    """
+    | Validate the market open and close tuples shared by the exchange-hours entry points.
+
+    :param market_open: Tuple containing the opening time of the market.
+    :param market_close: Tuple containing the closing time of the market.
+    """
+    if len(market_open) != 2 or len(market_close) != 2:
+        raise ValueError("Market open and close must be tuples with two elements.")
+    if not all(isinstance(item, int) for item in market_open):
+        raise TypeError("All elements in market_open must be integers")
+    if not all(isinstance(item, int) for item in market_close):
+        raise TypeError("All elements in market_close must be integers")
+
+
+@functools.lru_cache(maxsize=None)
+def _market_hours_expr(
+    market_open: tuple[int], market_close: tuple[int]
+) -> pl.Expr:
+    """
+    | Build the time-of-day filter expression for the given market hours, caching it so repeated
+    calls with the same hours (e.g. the 9:30-16:00 defaults) reuse the same expression object.
+
+    :param market_open: Tuple containing the opening time of the market.
+    :param market_close: Tuple containing the closing time of the market.
+    :return: Expression keeping only timestamps within market hours.
+    """
+    open_time = datetime.time(market_open[0], market_open[1])
+    close_time = datetime.time(market_close[0], market_close[1])
+    return pl.col(_TIME).dt.time().is_between(open_time, close_time, closed="both")
 
 
+def _exchange_hours_only_lazy(
+    t_data: pl.LazyFrame,
+    market_open: tuple[int] = (9, 30),
+    market_close: tuple[int] = (16, 0),
+    timezone: str | None = None,
+) -> pl.LazyFrame:
+    """
+    | Lazy core of :func:`exchange_hours_only`. Expects validated arguments and leaves sorting to the caller.
+
+    :param t_data: LazyFrame containing raw trade data.
+    :param market_open: Tuple containing the opening time of the market.
+    :param market_close: Tuple containing the closing time of the market.
+    :param timezone: Timezone of the data. If None, the data is assumed to be in UTC.
+    :return: LazyFrame containing only data from regular trading hours.
+    """
+
+    # filter the data on the cached time-of-day expression
+    df_filtered = t_data.filter(
+        _market_hours_expr(tuple(market_open), tuple(market_close))
+    )
+    if timezone:
+        # adjust the timezone leaving the timestamp unchanged
+        df_filtered = df_filtered.with_columns(
+            pl.col(_TIME).dt.replace_time_zone(timezone)
+        )
+
+    return df_filtered
+
+
+@_polars_input
 def exchange_hours_only(
     t_data: pl.DataFrame,
     market_open: tuple[int] = (9, 30),
@@ -198,45 +436,36 @@ def exchange_hours_only(
     #t_data = check_trade_data(t_data)
 
     # check market open and close are consistent
-    if len(market_open) != 2 or len(market_close) != 2:
-        raise ValueError("Market open and close must be tuples with two elements.")
-    if not all(isinstance(item, int) for item in market_open):
-        raise TypeError("All elements in market_open must be integers")
-    if not all(isinstance(item, int) for item in market_close):
-        raise TypeError("All elements in market_close must be integers")
-
-    # generate the market open and close durations
-    market_open_duration = pl.duration(hours=market_open[0], minutes=market_open[1])
-    market_close_duration = pl.duration(hours=market_close[0], minutes=market_close[1])
+    _check_market_hours(market_open, market_close)
 
-    # filter the data
-    df_filtered = t_data.filter(
-        (
-            pl.col(TColumns.TIME.value.name)
-            >= pl.col(TColumns.TIME.value.name).dt.truncate("1d") + market_open_duration
-        )
-        & (
-            pl.col(TColumns.TIME.value.name)
-            <= pl.col(TColumns.TIME.value.name).dt.truncate("1d") + market_close_duration
-        )
+    return (
+        _exchange_hours_only_lazy(t_data.lazy(), market_open, market_close, timezone)
+        .sort(_TIME)
+        .collect()
     )
-    if timezone:
-        # adjust the timezone leaving the timestamp unchanged
-        df_filtered = df_filtered.with_columns(
-            pl.col(TColumns.TIME.value.name).dt.replace_time_zone(timezone)
-        )
 
-    return df_filtered.sort(TColumns.TIME.value.name)
+
+def _remove_negative_spread_lazy(q_data: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    | Lazy core of :func:`remove_negative_spread`. Expects validated data and leaves sorting to the caller.
+
+    :param q_data: LazyFrame containing quote data.
+    :return: LazyFrame containing only data with positive spread.
+    """
+    return q_data.filter(pl.col(_OFR) > pl.col(_BID))
 
 
 # done and checked
+@_polars_input
 def remove_negative_spread(
     q_data: pl.DataFrame,
+    assume_sorted: bool = True,
 ) -> pl.DataFrame:
     """
     | Remove rows with negative spread from the raw Quote data.
 
     :param q_data: DataFrame containing quote data.
+    :param assume_sorted: If True, assume the input is already time-sorted and skip re-sorting.
     :return: DataFrame containing only data with positive spread.
     """
 
@@ -244,11 +473,145 @@ def remove_negative_spread(
     q_data = check_column_names(q_data)
     q_data = check_quote_data(q_data)
 
-    filtered_data = q_data.filter(pl.col(QColumns.OFR.value.name) > pl.col(QColumns.BID.value.name))
+    return _with_time_order(
+        _remove_negative_spread_lazy(q_data.lazy()),
+        _TIME,
+        assume_sorted,
+    ).collect()
 
-    return filtered_data.sort(QColumns.TIME.value.name)
 
+@_polars_input
+def clean_trades(
+    t_data: pl.DataFrame | pl.LazyFrame,
+    market_open: tuple[int] = (9, 30),
+    market_close: tuple[int] = (16, 0),
+    timezone: str | None = None,
+    streaming: bool = True,
+) -> pl.DataFrame:
+    """
+    | Run the standard trade cleaning pipeline (remove zero prices, keep exchange hours, sort by
+    time) as a single lazy plan and collect it with the streaming engine.
+
+    | Streaming processes the plan in chunks with bounded memory, which matters for whole-day
+    trade files where eager per-step materialization would peak at a multiple of the input size.
+
+    :param t_data: DataFrame or LazyFrame containing raw trade data.
+    :param market_open: Tuple containing the opening time of the market.
+    :param market_close: Tuple containing the closing time of the market.
+    :param timezone: Timezone of the data. If None, the data is assumed to be in UTC.
+    :param streaming: If True, collect with the streaming engine.
+    :return: Cleaned DataFrame sorted by time.
+    """
+
+    _check_market_hours(market_open, market_close)
+
+    t_data = check_column_names(t_data)
+    if isinstance(t_data, pl.LazyFrame):
+        lazy_data = _conform_schema(t_data, _TRADE_SCHEMA)
+    else:
+        t_data = check_trade_data(t_data)
+        lazy_data = t_data.lazy()
+
+    lazy_data = _no_zero_prices_lazy(lazy_data)
+    lazy_data = _exchange_hours_only_lazy(lazy_data, market_open, market_close, timezone)
+
+    return lazy_data.sort(_TIME).collect(streaming=streaming)
+
+
+@_polars_input
+def clean_quotes(
+    q_data: pl.DataFrame | pl.LazyFrame,
+    market_open: tuple[int] = (9, 30),
+    market_close: tuple[int] = (16, 0),
+    timezone: str | None = None,
+    streaming: bool = True,
+) -> pl.DataFrame:
+    """
+    | Run the standard quote cleaning pipeline (remove zero quotes, remove negative spreads, keep
+    exchange hours, sort by time) as a single lazy plan and collect it with the streaming engine.
+
+    :param q_data: DataFrame or LazyFrame containing raw quote data.
+    :param market_open: Tuple containing the opening time of the market.
+    :param market_close: Tuple containing the closing time of the market.
+    :param timezone: Timezone of the data. If None, the data is assumed to be in UTC.
+    :param streaming: If True, collect with the streaming engine.
+    :return: Cleaned DataFrame sorted by time.
+    """
 
+    _check_market_hours(market_open, market_close)
+
+    q_data = check_column_names(q_data)
+    if isinstance(q_data, pl.LazyFrame):
+        lazy_data = _conform_schema(q_data, _QUOTE_SCHEMA)
+    else:
+        q_data = check_quote_data(q_data)
+        lazy_data = q_data.lazy()
+
+    lazy_data = _no_zero_quotes_lazy(lazy_data)
+    lazy_data = _remove_negative_spread_lazy(lazy_data)
+    lazy_data = _exchange_hours_only_lazy(lazy_data, market_open, market_close, timezone)
+
+    return lazy_data.sort(_TIME).collect(streaming=streaming)
+
+
+def clean_all_trades(
+    t_data_by_symbol: dict[str, pl.DataFrame | pl.LazyFrame],
+    market_open: tuple[int] = (9, 30),
+    market_close: tuple[int] = (16, 0),
+    timezone: str | None = None,
+    streaming: bool = True,
+) -> dict[str, pl.DataFrame]:
+    """
+    | Clean the trade data of several symbols in one batched plan.
+
+    | Cleaning symbols one by one leaves the Polars thread pool idle between calls; concatenating
+    the per-symbol frames, running the trade cleaning pipeline once and partitioning the result
+    back by symbol lets the engine parallelize across all symbols at once.
+
+    :param t_data_by_symbol: Dictionary mapping symbols to DataFrames or LazyFrames with raw trade data.
+    :param market_open: Tuple containing the opening time of the market.
+    :param market_close: Tuple containing the closing time of the market.
+    :param timezone: Timezone of the data. If None, the data is assumed to be in UTC.
+    :param streaming: If True, collect with the streaming engine.
+    :return: Dictionary mapping each symbol to its cleaned, time-sorted DataFrame. Symbols whose
+        rows are all filtered out map to an empty DataFrame with the same schema.
+    """
+
+    if not isinstance(t_data_by_symbol, dict) or len(t_data_by_symbol) < 1:
+        raise ValueError("t_data_by_symbol must be a dictionary with at least one entry")
+
+    _check_market_hours(market_open, market_close)
+
+    parts = []
+    for symbol, t_data in t_data_by_symbol.items():
+        if not isinstance(t_data, (pl.DataFrame, pl.LazyFrame)):
+            raise TypeError("All values of t_data_by_symbol must be polars DataFrames or LazyFrames")
+        t_data = check_column_names(t_data)
+        if isinstance(t_data, pl.LazyFrame):
+            t_data = _conform_schema(t_data, _TRADE_SCHEMA)
+        else:
+            t_data = check_trade_data(t_data)
+            t_data = t_data.lazy()
+        # stamp the symbol from the dictionary key so the final partitioning is authoritative
+        parts.append(t_data.with_columns(pl.lit(symbol).alias(_SYMBOL)))
+
+    # diagonal concat aligns the parts by column name, so dict values with the same columns in a
+    # different order still stack
+    combined = pl.concat(parts, how="diagonal")
+    combined = _no_zero_prices_lazy(combined)
+    combined = _exchange_hours_only_lazy(combined, market_open, market_close, timezone)
+    cleaned = combined.sort(_TIME).collect(streaming=streaming)
+
+    # seed with empty frames so symbols whose rows are all filtered out keep their key
+    results = {symbol: cleaned.clear() for symbol in t_data_by_symbol}
+    results.update(
+        (key[0], frame)
+        for key, frame in cleaned.partition_by(_SYMBOL, as_dict=True).items()
+    )
+    return results
+
+
+@_polars_input
 def gather_prices(data: pl.DataFrame) -> pl.DataFrame:
     """
     | Convenience function to gather data from one Dataframe with at least a column 'dt', and d columns with prices.
@@ -258,10 +621,6 @@ def gather_prices(data: pl.DataFrame) -> pl.DataFrame:
     :return: DataFrame with columns 'dt', 'symbol', and 'price'.
     """
 
-    # Check if the input is a polars DataFrame
-    if not isinstance(data, pl.DataFrame):
-        raise ValueError("Input must be a polars DataFrame.")
-
     # Check for the 'dt' column
     if "dt" not in data.columns:
         raise ValueError("Data must contain a dt column.")
@@ -275,6 +634,7 @@ def gather_prices(data: pl.DataFrame) -> pl.DataFrame:
     return melted_data
 
 
+@_polars_input
 def spread_prices(data: pd.DataFrame) -> pl.DataFrame:
     """
     | Convenience function to spread data from a DataFrame with columns 'dt', 'symbol', and 'price' into a DataFrame
@@ -284,9 +644,6 @@ def spread_prices(data: pd.DataFrame) -> pl.DataFrame:
     :return: DataFrame where each symbol has its own column.
     """
 
-    if not isinstance(data, pl.DataFrame):
-        raise ValueError("Input must be a polars DataFrame.")
-
     required_columns = ["dt", "symbol", "price"]
     missing_columns = [col for col in required_columns if col not in data.columns]
     if missing_columns:
@@ -306,6 +663,7 @@ def spread_prices(data: pd.DataFrame) -> pl.DataFrame:
 
 
 # done and checked
+@_polars_input
 def trade_condition(
         t_data: pl.DataFrame,
         valid_conds: List[str] = ('', '@', 'E', '@E', 'F', 'FI', '@F', '@FI', 'I', '@I')
@@ -322,20 +680,20 @@ def trade_condition(
     t_data = check_column_names(t_data)
     t_data = check_trade_data(t_data)
 
-    if TColumns.CONDITION.value.name not in t_data.columns:
+    if _COND not in t_data.columns:
         raise KeyError("Data must contain a cond column.")
 
     # fill missing values with '' for unknown
     t_data = t_data.with_columns(
-        pl.col(TColumns.CONDITION.value.name).fill_null("").alias(TColumns.CONDITION.value.name)
+        pl.col(_COND).fill_null("").alias(_COND)
     )
 
     # filter the data
     t_data = t_data.filter(
-        pl.col(TColumns.CONDITION.value.name).str.replace_all(r"\s", "").is_in(valid_conds)
+        pl.col(_COND).str.replace_all(r"\s", "").is_in(valid_conds)
     )
 
-    return t_data.sort(TColumns.TIME.value.name)
+    return t_data.sort(_TIME)
 
 
 def refresh_time(
@@ -383,10 +741,10 @@ def refresh_time(
     for df in p_data_list:
         if df.shape[1] != 2:
             raise ValueError("Each DataFrame must have exactly two columns")
-        if TColumns.TIME.value.name not in df.columns:
+        if _TIME not in df.columns:
             raise ValueError("Each DataFrame must have a dt column")
         # TODO: Shouldn't we check that the date is the same for all timeseries?
-        dates = df.select(pl.col(TColumns.TIME.value.name).dt.date()).unique().to_series()
+        dates = df.select(pl.col(_TIME).dt.date()).unique().to_series()
         if len(dates) > 1:
             raise ValueError("All DataFrames must contain data for a single day")
 
@@ -404,15 +762,15 @@ def refresh_time(
         # Define the sorting criterion function
         if criterion == 'squared duration':
             def compute_criterion(df):
-                durations = df.sort(TColumns.TIME.value.name).select(
-                    (pl.col(TColumns.TIME.value.name).shift(-1) - pl.col(TColumns.TIME.value.name))
-                )[:-1][TColumns.TIME.value.name].to_list()
+                durations = df.sort(_TIME).select(
+                    (pl.col(_TIME).shift(-1) - pl.col(_TIME))
+                )[:-1][_TIME].to_list()
                 return sum([delta.total_seconds()**2 for delta in durations])
         elif criterion == 'duration':
             def compute_criterion(df):
-                durations = df.sort(TColumns.TIME.value.name).select(
-                    (pl.col(TColumns.TIME.value.name).shift(-1) - pl.col(TColumns.TIME.value.name))
-                )[:-1][TColumns.TIME.value.name].to_list()
+                durations = df.sort(_TIME).select(
+                    (pl.col(_TIME).shift(-1) - pl.col(_TIME))
+                )[:-1][_TIME].to_list()
                 return sum([delta.total_seconds() for delta in durations])
         else:
             raise ValueError("Criterion must be either 'squared duration' or 'duration'")
@@ -426,30 +784,30 @@ def refresh_time(
 
     if not data_names:
         # check if names are unique
-        if len({col for df in p_data_list for col in df.columns if col != TColumns.TIME.value.name}) == len(p_data_list):
-            data_names = [col for df in p_data_list for col in df.columns if col != TColumns.TIME.value.name]
+        if len({col for df in p_data_list for col in df.columns if col != _TIME}) == len(p_data_list):
+            data_names = [col for df in p_data_list for col in df.columns if col != _TIME]
         else:
             data_names = ['price_' + str(i) for i in range(len(p_data_list))]
 
     # Rename the columns
     for i, df in enumerate(p_data_list):
-        df = df.sort(TColumns.TIME.value.name)
-        value_col = [col for col in df.columns if col != TColumns.TIME.value.name][0]
+        df = df.sort(_TIME)
+        value_col = [col for col in df.columns if col != _TIME][0]
         df = df.rename({value_col: data_names[i]})
         p_data_list[i] = df
 
-    # Merge all dataframes on TColumns.TIME.value.name using an outer join
+    # Merge all dataframes on _TIME using an outer join
     merged_df = p_data_list[0]
     for df in p_data_list[1:]:
-        merged_df = merged_df.join(df, on=TColumns.TIME.value.name, how='full', coalesce=True)
+        merged_df = merged_df.join(df, on=_TIME, how='full', coalesce=True)
 
-    # Sort merged dataframe by TColumns.TIME.value.name
-    merged_df = merged_df.sort(TColumns.TIME.value.name)
+    # Sort merged dataframe by _TIME
+    merged_df = merged_df.sort(_TIME)
 
 
     # generate column with the 1 for non-null values and 0 for null values
     cum_counts = [
-        merged_df[col].is_not_null().cast(pl.Int8).alias(f'mark_{col}')
+        pl.col(col).is_not_null().cast(pl.Int8).alias(f'mark_{col}')
         for col in data_names
     ]
 
@@ -472,11 +830,12 @@ def refresh_time(
         refresh_times.append(prev_refresh)
     merged_df = merged_df.with_columns(pl.Series("refresh", refresh_times))
     merged_df = merged_df.filter(pl.col("refresh"))
-    merged_df = merged_df[[TColumns.TIME.value.name] + data_names]
+    merged_df = merged_df[[_TIME] + data_names]
 
     return merged_df
 
 
+@_polars_input
 def remove_large_spread(
         q_data: pl.DataFrame,
         maximum_spread: float = 50,
@@ -496,8 +855,8 @@ def remove_large_spread(
 
     # Extract DATE and Calculate SPREAD
     q_data = q_data.with_columns([
-        pl.col(QColumns.TIME.value.name).dt.date().alias('DATE'),
-        (pl.col(QColumns.OFR.value.name) - pl.col(QColumns.BID.value.name)).alias('SPREAD')
+        pl.col(_TIME).dt.date().alias('DATE'),
+        (pl.col(_OFR) - pl.col(_BID)).alias('SPREAD')
     ])
 
     # Calculate the median spread per day
@@ -515,9 +874,10 @@ def remove_large_spread(
     # Drop Auxiliary Columns
     q_data = q_data.drop(['DATE', 'SPREAD', 'SPREAD_MEDIAN'])
 
-    return q_data.sort(QColumns.TIME.value.name)
+    return q_data.sort(_TIME)
 
 
+@_polars_input
 def merge_trades_same_timestamp(
         t_data: pl.DataFrame,
         selection: str = "median"
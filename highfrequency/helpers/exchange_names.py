@@ -12,4 +12,6 @@ EXCHANGES = {
     "M": "Chicago",
     "W": "CBOE",
     "Z": "BATS"
-}
\ No newline at end of file
+}
+# frozen key set for O(1) membership checks; EXCHANGES stays the code-to-name lookup
+EXCHANGE_KEYS = frozenset(EXCHANGES)
@@ -1,68 +1,94 @@
+import functools
 import polars as pl
-import warnings
-import numpy as np
 from .helpers.schemas import TColumns, QColumns, column_name_mapper
 
 
+def _polars_input(fn):
+    """
+    | Decorator checking once per call that the first argument of a data handling entry point is a
+    polars DataFrame or LazyFrame. The undecorated lazy cores skip the check for internal chaining.
+
+    :param fn: Function whose first positional argument must be a polars frame.
+    :return: Wrapped function raising TypeError on other input types.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(df, *args, **kwargs):
+        if not isinstance(df, (pl.DataFrame, pl.LazyFrame)):
+            raise TypeError(f"{fn.__name__} expects a polars DataFrame or LazyFrame")
+        return fn(df, *args, **kwargs)
+
+    return wrapper
+
+
+# static required-column tables, derived once from the enums
+_TRADE_SCHEMA = {column.value.name: column.value.dtype for column in TColumns}
+_QUOTE_SCHEMA = {column.value.name: column.value.dtype for column in QColumns}
+
+
+def _conform_schema(df, required):
+    """
+    | Check that the necessary columns are present and cast any column whose data type differs from
+    the canonical one, instead of raising. All casts are applied in a single with_columns pass.
+
+    | Works on DataFrames as well as LazyFrames; missing columns still raise KeyError.
+
+    :param df: DataFrame or LazyFrame to conform.
+    :param required: Mapping of required column names to their expected data types,
+        either _TRADE_SCHEMA or _QUOTE_SCHEMA.
+    :return: Frame with all required columns in their canonical data types.
+    """
+
+    schema = df.collect_schema() if isinstance(df, pl.LazyFrame) else df.schema
+
+    coercions = []
+    for name, expected in required.items():
+        # check column is present
+        actual = schema.get(name)
+        if actual is None:
+            raise KeyError(f"Column {name} not found in DataFrame columns.")
+
+        # cast mismatched columns to the canonical data type
+        if expected is not None:
+            if isinstance(expected, list):
+                if not any(actual == dtype for dtype in expected):
+                    coercions.append(pl.col(name).cast(expected[0]))
+            elif actual != expected:
+                coercions.append(pl.col(name).cast(expected))
+
+    if coercions:
+        df = df.with_columns(coercions)
+    return df
+
+
 def check_trade_data(df: pl.DataFrame) -> pl.DataFrame:
     """
     | Check if the input price data is a polars DataFrame and that the necessary columns are present.
-    Additionally, the data types of the columns are checked.
+    Additionally, columns whose data types differ from the canonical ones are cast instead of rejected.
 
     :param df: DataFrame to be checked.
-    :return: DataFrame if it is a polars DataFrame.
+    :return: DataFrame with the canonical trade schema.
     """
 
     if not isinstance(df, pl.DataFrame):
         raise TypeError("df must be a polars DataFrame")
 
-    df_schema = df.schema
-
-    for column in TColumns:
-        # check column is present
-        if column.value.name not in df_schema:
-            raise KeyError(f"Column {column.value.name} not found in DataFrame columns.")
-
-        # check column data type
-        if column.value.dtype is not None:
-            if not isinstance(column.value.dtype, list):
-                if df_schema[column.value.name] != column.value.dtype:
-                    raise TypeError(f"Column {column.value.name} should be of type {column.value.dtype}.")
-            else:
-                if not any(df_schema[column.value.name] == dtype for dtype in column.value.dtype):
-                    raise TypeError(f"Column {column.value.name} should be of type {column.value.dtype}.")
-
-    return df
+    return _conform_schema(df, _TRADE_SCHEMA)
 
 
 def check_quote_data(df: pl.DataFrame) -> pl.DataFrame:
     """
     | Check if the input quote data is a polars DataFrame and that the necessary columns are present.
-    Additionally, the data types of the columns are checked.
+    Additionally, columns whose data types differ from the canonical ones are cast instead of rejected.
 
     :param df: DataFrame to be checked.
-    :return: DataFrame if it is a polars DataFrame.
+    :return: DataFrame with the canonical quote schema.
     """
 
     if not isinstance(df, pl.DataFrame):
         raise TypeError("df must be a polars DataFrame.")
 
-    df_schema = df.schema
-
-    for column in QColumns:
-        # check column is present
-        if column.value.name not in df_schema:
-            raise KeyError(f"Column {column.value.name} not found in DataFrame columns.")
-
-        # check column data type
-        if column.value.dtype is not None:
-            if not isinstance(column.value.dtype, list):
-                if df_schema[column.value.name] != column.value.dtype:
-                    raise TypeError(f"Column {column.value.name} should be of type {column.value.dtype}.")
-            else:
-                if not any(df_schema[column.value.name] == dtype for dtype in column.value.dtype):
-                    raise TypeError(f"Column {column.value.name} should be of type {column.value.dtype}.")
-    return df
+    return _conform_schema(df, _QUOTE_SCHEMA)
 
 
 def check_column_names(df: pl.DataFrame) -> pl.DataFrame:
@@ -74,12 +100,18 @@ def check_column_names(df: pl.DataFrame) -> pl.DataFrame:
     :return: DataFrame with column names set according to RTAQ format.
     """
 
-    # lowercase all column names
-    df = df.rename({col: col.lower() for col in df.columns})
-
-    # Apply the renaming map only if the column exists in the dataframe
-    df = df.rename({old: new for old, new in column_name_mapper.items() if old in df.columns})
-
-    return df
-
-
+    # lowercase the column names and apply the RTAQ renaming map in a single rename pass,
+    # keeping only the columns whose name actually changes
+    columns = (
+        df.collect_schema().names() if isinstance(df, pl.LazyFrame) else df.columns
+    )
+    mapping = {}
+    for col in columns:
+        target = column_name_mapper.get(col.lower(), col.lower())
+        if col != target:
+            mapping[col] = target
+
+    # already-normalized frames skip the rename entirely
+    if not mapping:
+        return df
+    return df.rename(mapping)
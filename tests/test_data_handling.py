@@ -36,4 +36,97 @@ class TestInternalDataHandling:
         assert df.equals(expected_df)
 
     def test_select_exchange(self):
-        pass
\ No newline at end of file
+        pass
+
+    def test_clean_trades(self):
+        df = pl.DataFrame({
+            'dt': ["2018-01-02 09:31:21.479", "2018-01-02 05:01:22.479", "2018-01-02 10:00:00.000"],
+            'price': [1.5, 2.0, 0.0],
+            'size': [1, 2, 3],
+            'symbol': ['AAPL', 'AAPL', 'AAPL'],
+            'cond': ['', '', ''],
+            'ex': ['N', 'N', 'N'],
+            'corr': [0, 0, 0]
+        })
+        df = df.with_columns(
+            pl.col('dt').str.to_datetime("%Y-%m-%d %H:%M:%S%.6f")
+        )
+
+        # zero prices and rows outside market hours are dropped
+        out = clean_trades(df)
+        assert out['price'].to_list() == [1.5]
+
+        # market hour tuples are validated like in exchange_hours_only
+        with pytest.raises(ValueError):
+            clean_trades(df, market_open=(9,))
+        with pytest.raises(TypeError):
+            clean_trades(df, market_close=(16, 'zero'))
+
+    def test_clean_quotes(self):
+        df = pl.DataFrame({
+            'dt': ["2018-01-02 09:31:21.479", "2018-01-02 09:31:22.479", "2018-01-02 05:01:23.479"],
+            'bid': [1.1, 2.1, 1.1],
+            'ofr': [2.1, 1.1, 2.1],
+            'bidsiz': [1, 2, 3],
+            'ofrsiz': [2, 1, 3],
+            'symbol': ['AAPL', 'AAPL', 'AAPL'],
+            'ex': ['N', 'N', 'N']
+        })
+        df = df.with_columns(
+            pl.col('dt').str.to_datetime("%Y-%m-%d %H:%M:%S%.6f")
+        )
+
+        # negative spreads and rows outside market hours are dropped
+        out = clean_quotes(df)
+        assert out['bid'].to_list() == [1.1]
+
+        # market hour tuples are validated like in exchange_hours_only
+        with pytest.raises(ValueError):
+            clean_quotes(df, market_open=(9,))
+
+    def test_clean_all_trades(self):
+        aapl = pl.DataFrame({
+            'dt': ["2018-01-02 09:31:21.479", "2018-01-02 09:31:22.479"],
+            'price': [1.5, 0.0],
+            'size': [1, 2],
+            'symbol': ['AAPL', 'AAPL'],
+            'cond': ['', ''],
+            'ex': ['N', 'N'],
+            'corr': [0, 0]
+        })
+        aapl = aapl.with_columns(
+            pl.col('dt').str.to_datetime("%Y-%m-%d %H:%M:%S%.6f")
+        )
+        # same columns in a different order must still concatenate
+        msft = aapl.select(['price', 'dt', 'size', 'symbol', 'cond', 'ex', 'corr'])
+        msft = msft.with_columns(pl.col('price').replace(1.5, 2.5))
+        # every row of this symbol is filtered out
+        empty = aapl.with_columns(pl.lit(0.0).alias('price'))
+
+        out = clean_all_trades({'AAPL': aapl, 'MSFT': msft, 'GONE': empty})
+        assert set(out.keys()) == {'AAPL', 'MSFT', 'GONE'}
+        assert out['AAPL']['price'].to_list() == [1.5]
+        assert out['MSFT']['price'].to_list() == [2.5]
+        assert out['GONE'].is_empty()
+
+    def test_no_zero_prices_assume_sorted(self):
+        df = pl.DataFrame({
+            'dt': ["2018-01-02 05:01:22.479", "2018-01-02 05:01:21.479"],
+            'price': [1.5, 0.0],
+            'size': [1, 2],
+            'symbol': ['AAPL', 'AAPL'],
+            'cond': ['', ''],
+            'ex': ['N', 'N'],
+            'corr': [0, 0]
+        })
+        df = df.with_columns(
+            pl.col('dt').str.to_datetime("%Y-%m-%d %H:%M:%S%.6f")
+        )
+
+        # with assume_sorted=True the input order is kept, only zero prices are dropped
+        out = no_zero_prices(df)
+        assert out['price'].to_list() == [1.5]
+
+        # with assume_sorted=False the result is re-sorted by time
+        out = no_zero_prices(df.vstack(df), assume_sorted=False)
+        assert out['dt'].is_sorted()
\ No newline at end of file
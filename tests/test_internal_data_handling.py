@@ -52,13 +52,20 @@ class TestInternalDataHandling:
         except KeyError as e:
             assert str(e) == "'Column dt not found in DataFrame columns.'"
 
-        # test dt column type
-        df = pl.DataFrame({'dt': [1, 2, 3], 'bid': [1, 2, 3], 'ofr': [1, 2, 3]})
-        try:
-            df = check_quote_data(df)
-        except TypeError as e:
-            assert str(e) == "Column dt should be of type Datetime."
-
+        # non-canonical dtypes are coerced instead of rejected
+        df = pl.DataFrame({
+            'dt': [1],
+            'bid': [1],
+            'ofr': [1],
+            'bidsiz': [1],
+            'ofrsiz': [1],
+            'symbol': ['AAPL'],
+            'ex': ['N'],
+        })
+        df = check_quote_data(df)
+        assert df.schema['dt'] == pl.Datetime
+        assert df.schema['bid'] == pl.Float64
+        assert df.schema['ofr'] == pl.Float64
 
         # test bidsize column
         df = pl.DataFrame({'dt': ["2018-01-02 05:01:21.479"], 'ofr': [1]})